@@ -0,0 +1,21 @@
+from setuptools import Extension, setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+# Optional C backend for the buy-vs-rent simulation kernel; the pure
+# Python / Numba implementation is used when it is not built.
+extensions = [
+    Extension(
+        "src._buy_vs_rent_core",
+        ["src/_buy_vs_rent_core.pyx"],
+        extra_compile_args=["-O3", "-ffast-math"],
+    )
+]
+
+setup(
+    name="finantial-tools",
+    ext_modules=cythonize(extensions) if cythonize is not None else [],
+)
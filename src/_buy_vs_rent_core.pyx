@@ -0,0 +1,300 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""Cython backend for the buy-vs-rent simulation kernel.
+
+Typed translation of buy_vs_rent._simulate: same positional interface, same
+closed-form year step with an explicit monthly loop for the payoff year.
+Build with `python setup.py build_ext --inplace`; buy_vs_rent picks it up
+automatically and falls back to the Numba/Python kernel when the extension
+is not compiled. All locals are C doubles and the body holds no Python
+objects, so the GIL is released for the whole simulation.
+"""
+
+from libc.math cimport expm1, log1p
+
+
+cdef inline double geometric_sum(double ratio, int n) nogil:
+    """Sum of ratio**k for k in range(n)."""
+    if ratio - 1.0 < 1e-12 and ratio - 1.0 > -1e-12:
+        return <double>n
+    return (ratio ** n - 1.0) / (ratio - 1.0)
+
+
+cdef inline double mixed_geometric_sum(double r, double g, int n) nogil:
+    """Sum of g**k * r**(n - 1 - k) for k in range(n)."""
+    if r - g < 1e-12 and r - g > -1e-12:
+        return n * r ** (n - 1)
+    return (r ** n - g ** n) / (r - g)
+
+
+cpdef void simulate(
+    double yearly_inflation_rate,
+    double yearly_apartment_raise_rate,
+    double mortgage_apartment_price,
+    double mortgage_interest_rate,
+    double mortgage_yearly_repayment_rate,
+    long mortgate_refinancing_years,
+    double etf_yearly_return_rate,
+    double cold_rent_monthly_cost,
+    double cold_rent_yearly_increase_rate,
+    double initial_cash,
+    double initial_loan,
+    double monthly_net_income,
+    double monthly_spending,
+    double yearly_income_increase_rate,
+    long years,
+    double sondertilgung_yearly_rate,
+    double etf_tax_rate,
+    double[::1] total_loan,
+    double[::1] estimated_total_capital,
+    double[::1] monthly_interest_payment_out,
+    double[::1] monthly_loan_repayment_out,
+    double[::1] monthly_rent_out,
+    double[::1] monthly_apartment_spend_out,
+    double[::1] monthly_spending_out,
+    double[::1] monthly_income_out,
+    double[::1] monthly_leftover_out,
+    double[::1] invested_capital_out,
+    double[::1] etf_capital_out,
+    double[::1] etf_capital_after_tax_out,
+    double[::1] spending_not_covered_out,
+    double[::1] property_value_out,
+    double[::1] property_equity_out,
+    double[::1] yearly_sondertilgung_out,
+    double[::1] cumulative_interest_paid_out,
+) nogil:
+    cdef double loan_outstanding = initial_loan
+    cdef double invested_capital = initial_cash
+    cdef double etf_capital = initial_cash
+    cdef double etf_cost_basis = initial_cash
+
+    cdef double fixed_monthly_payment = loan_outstanding * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+
+    cdef double current_monthly_income = monthly_net_income
+    cdef double current_monthly_rent = cold_rent_monthly_cost
+    cdef double current_monthly_spending = monthly_spending
+
+    # expm1/log1p form of (1 + r) ** (1 / 12) - 1; exact for small rates
+    cdef double monthly_inflation_rate = expm1(log1p(yearly_inflation_rate) / 12.0)
+    cdef double monthly_etf_rate = expm1(log1p(etf_yearly_return_rate) / 12.0)
+
+    cdef double max_sondertilgung = loan_outstanding * sondertilgung_yearly_rate
+    cdef double sondertilgung_monthly_reserve = max_sondertilgung / 12.0
+    cdef double cumulative_interest_paid = 0.0
+
+    cdef double monthly_interest_rate = mortgage_interest_rate / 12.0
+    cdef double annuity_payment_rate = (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+    cdef double apt_growth = 1.0 + yearly_apartment_raise_rate
+    cdef double income_growth = 1.0 + yearly_income_increase_rate
+    cdef double rent_growth = 1.0 + cold_rent_yearly_increase_rate
+    cdef double r = 1.0 + monthly_etf_rate
+    cdef double g = 1.0 + monthly_inflation_rate
+    cdef double q = 1.0 + monthly_interest_rate
+    cdef double r12 = r ** 12
+    cdef double g11 = g ** 11
+    cdef double g12 = g11 * g
+    cdef double q12 = q ** 12
+    cdef double gs_r = geometric_sum(r, 12)
+    cdef double gs_g = geometric_sum(g, 12)
+    cdef double gs_q = geometric_sum(q, 12)
+    cdef double mixed_rg = mixed_geometric_sum(r, g, 12)
+
+    cdef double property_value = mortgage_apartment_price
+
+    cdef long year
+    cdef int months_with_loan
+    cdef int remaining_months
+    cdef double spend_sum
+    cdef double loan_after
+    cdef double total_interest_paid_this_year
+    cdef double total_principal_paid_this_year
+    cdef double total_monthly_spending_this_year
+    cdef double monthly_leftover
+    cdef double leftover_sum
+    cdef double reserved_sum
+    cdef double monthly_interest_payment
+    cdef double monthly_loan_repayment
+    cdef double actual_mortgage_payment
+    cdef double current_sondertilgung_reserve
+    cdef double monthly_apartment_spend
+    cdef double leftover_const
+    cdef double contribution_const
+    cdef double invested_delta
+    cdef double actual_sondertilgung
+    cdef double avg_monthly_interest
+    cdef double avg_monthly_repayment
+    cdef double avg_monthly_spending
+    cdef double etf_gain
+    cdef double etf_capital_after_tax
+    cdef double property_equity
+
+    for year in range(1, years + 1):
+        # Property value grows with inflation as a proxy
+        property_value *= apt_growth
+
+        # Loan balance after 12 unclamped annuity months; if this goes
+        # non-positive the loan is repaid mid-year and the closed forms for
+        # the mortgage no longer hold.
+        if loan_outstanding > 0:
+            loan_after = loan_outstanding * q12 - fixed_monthly_payment * gs_q
+        else:
+            loan_after = 0.0
+
+        if loan_outstanding > 0 and loan_after <= 0.0:
+            # Payoff year: simulate only the months that still carry the
+            # loan explicitly; once it is repaid the rest of the year has no
+            # mortgage flows and collapses to the loan-free closed forms.
+            total_interest_paid_this_year = 0.0
+            total_principal_paid_this_year = 0.0
+            total_monthly_spending_this_year = 0.0
+            monthly_leftover = 0.0
+            leftover_sum = 0.0
+            months_with_loan = 0
+
+            while loan_outstanding > 0 and months_with_loan < 12:
+                monthly_interest_payment = loan_outstanding * monthly_interest_rate
+                monthly_loan_repayment = fixed_monthly_payment - monthly_interest_payment
+                if monthly_loan_repayment > loan_outstanding:
+                    monthly_loan_repayment = loan_outstanding
+                actual_mortgage_payment = monthly_interest_payment + monthly_loan_repayment
+                # Branchless clamp at payoff; max lowers to a single maxsd
+                loan_outstanding = max(loan_outstanding - monthly_loan_repayment, 0.0)
+                if loan_outstanding <= 0.0:
+                    fixed_monthly_payment = 0.0
+                months_with_loan += 1
+
+                total_interest_paid_this_year += monthly_interest_payment
+                total_principal_paid_this_year += monthly_loan_repayment
+                total_monthly_spending_this_year += current_monthly_spending
+
+                monthly_apartment_spend = current_monthly_rent + actual_mortgage_payment
+
+                monthly_leftover = (
+                    current_monthly_income
+                    - monthly_apartment_spend
+                    - current_monthly_spending
+                )
+                leftover_sum += monthly_leftover
+                etf_capital = etf_capital * r + monthly_leftover - sondertilgung_monthly_reserve
+                current_monthly_spending *= g
+
+            reserved_sum = months_with_loan * sondertilgung_monthly_reserve
+
+            remaining_months = 12 - months_with_loan
+            if remaining_months > 0:
+                spend_sum = current_monthly_spending * geometric_sum(g, remaining_months)
+                total_monthly_spending_this_year += spend_sum
+                leftover_const = current_monthly_income - current_monthly_rent
+                etf_capital = (
+                    etf_capital * r ** remaining_months
+                    + leftover_const * geometric_sum(r, remaining_months)
+                    - current_monthly_spending * mixed_geometric_sum(r, g, remaining_months)
+                )
+                leftover_sum += remaining_months * leftover_const - spend_sum
+                monthly_leftover = (
+                    leftover_const - current_monthly_spending * g ** (remaining_months - 1)
+                )
+                current_monthly_spending *= g ** remaining_months
+
+            # Uncompounded totals only need one update per year: invested
+            # capital is the accumulated leftover, and the ETF cost basis is
+            # the same minus what was reserved for sondertilgung
+            invested_capital += leftover_sum
+            etf_cost_basis += leftover_sum - reserved_sum
+        else:
+            # Regular year: the loan stays on the annuity schedule (or is
+            # already fully repaid), so every monthly quantity is a geometric
+            # series in r, g or q.
+            if loan_outstanding > 0:
+                actual_mortgage_payment = fixed_monthly_payment
+                current_sondertilgung_reserve = sondertilgung_monthly_reserve
+                total_principal_paid_this_year = loan_outstanding - loan_after
+                total_interest_paid_this_year = (
+                    12.0 * fixed_monthly_payment - total_principal_paid_this_year
+                )
+                loan_outstanding = loan_after
+            else:
+                actual_mortgage_payment = 0.0
+                current_sondertilgung_reserve = 0.0
+                total_principal_paid_this_year = 0.0
+                total_interest_paid_this_year = 0.0
+
+            # Spending starts at current_monthly_spending and grows by g each
+            # month; leftover is the constant part minus that growing spending.
+            total_monthly_spending_this_year = current_monthly_spending * gs_g
+            monthly_apartment_spend = current_monthly_rent + actual_mortgage_payment
+            leftover_const = current_monthly_income - monthly_apartment_spend
+            contribution_const = leftover_const - current_sondertilgung_reserve
+
+            etf_capital = (
+                etf_capital * r12
+                + contribution_const * gs_r
+                - current_monthly_spending * mixed_rg
+            )
+            invested_delta = 12.0 * leftover_const - total_monthly_spending_this_year
+            invested_capital += invested_delta
+            etf_cost_basis += invested_delta - 12.0 * current_sondertilgung_reserve
+
+            # Last month's leftover, reported below
+            monthly_leftover = leftover_const - current_monthly_spending * g11
+            current_monthly_spending *= g12
+
+        # Apply sondertilgung at year end
+        actual_sondertilgung = 0.0
+        if loan_outstanding > 0 and max_sondertilgung > 0:
+            actual_sondertilgung = max_sondertilgung
+            if actual_sondertilgung > loan_outstanding:
+                actual_sondertilgung = loan_outstanding
+            loan_outstanding -= actual_sondertilgung
+            if loan_outstanding <= 0:
+                loan_outstanding = 0.0
+                fixed_monthly_payment = 0.0
+
+        cumulative_interest_paid += total_interest_paid_this_year
+
+        # Average monthly values for reporting
+        avg_monthly_interest = total_interest_paid_this_year / 12.0
+        avg_monthly_repayment = total_principal_paid_this_year / 12.0
+        avg_monthly_spending = total_monthly_spending_this_year / 12.0
+        monthly_apartment_spend = current_monthly_rent + fixed_monthly_payment
+
+        # ETF after tax: tax only on gains, not on cost basis
+        etf_gain = etf_capital - etf_cost_basis
+        if etf_gain < 0.0:
+            etf_gain = 0.0
+        etf_capital_after_tax = etf_capital - etf_gain * etf_tax_rate
+
+        # Estimated total capital = invested capital + property equity
+        property_equity = property_value - loan_outstanding
+        estimated_total_capital[year] = property_equity + etf_capital_after_tax
+
+        total_loan[year] = loan_outstanding
+        monthly_interest_payment_out[year] = avg_monthly_interest
+        monthly_loan_repayment_out[year] = avg_monthly_repayment
+        monthly_rent_out[year] = current_monthly_rent
+        monthly_apartment_spend_out[year] = monthly_apartment_spend
+        monthly_spending_out[year] = current_monthly_spending
+        monthly_income_out[year] = current_monthly_income
+        monthly_leftover_out[year] = monthly_leftover
+        invested_capital_out[year] = invested_capital
+        etf_capital_out[year] = etf_capital
+        etf_capital_after_tax_out[year] = etf_capital_after_tax
+        spending_not_covered_out[year] = (
+            (avg_monthly_spending + monthly_apartment_spend)
+            - (etf_capital_after_tax * 3 / 100) / 12
+        )
+        property_value_out[year] = property_value
+        property_equity_out[year] = property_equity
+        yearly_sondertilgung_out[year] = actual_sondertilgung
+        cumulative_interest_paid_out[year] = cumulative_interest_paid
+
+        # Prepare next year values (income/rent growth and possible refinancing)
+        current_monthly_income *= income_growth
+        current_monthly_rent *= rent_growth
+
+        # Recalculate fixed payment on refinancing schedule
+        if (
+            loan_outstanding > 0
+            and mortgate_refinancing_years > 0
+            and (year % mortgate_refinancing_years == 0)
+        ):
+            fixed_monthly_payment = loan_outstanding * annuity_payment_rate
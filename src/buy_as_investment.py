@@ -1,3 +1,6 @@
+from math import expm1, log1p
+
+import numpy as np
 import pandas as pd
 
 
@@ -36,19 +39,21 @@ def compute_investment_property_model(
     - monthly_surplus: rental_income - mortgage_payment + monthly_savings
     """
 
-    # Type assertions
-    assert isinstance(mortgage_apartment_price, (int, float))
-    assert isinstance(mortgage_interest_rate, (int, float))
-    assert isinstance(mortgage_down_payment_rate, (int, float))
-    assert isinstance(mortgage_total_fees_rate, (int, float))
-    assert isinstance(mortgage_yearly_repayment_rate, (int, float))
+    # Normalize the numeric parameters once: float() both rejects
+    # non-numeric input and keeps all downstream arithmetic on the C-level
+    # float fast path
+    mortgage_apartment_price = float(mortgage_apartment_price)
+    mortgage_interest_rate = float(mortgage_interest_rate)
+    mortgage_down_payment_rate = float(mortgage_down_payment_rate)
+    mortgage_total_fees_rate = float(mortgage_total_fees_rate)
+    mortgage_yearly_repayment_rate = float(mortgage_yearly_repayment_rate)
+    rental_income_monthly = float(rental_income_monthly)
+    rental_income_yearly_increase_rate = float(rental_income_yearly_increase_rate)
+    yearly_apartment_raise_rate = float(yearly_apartment_raise_rate)
+    etf_yearly_return_rate = float(etf_yearly_return_rate)
+    initial_capital = float(initial_capital)
+    monthly_savings = float(monthly_savings)
     assert isinstance(mortgate_refinancing_years, int)
-    assert isinstance(rental_income_monthly, (int, float))
-    assert isinstance(rental_income_yearly_increase_rate, (int, float))
-    assert isinstance(yearly_apartment_raise_rate, (int, float))
-    assert isinstance(etf_yearly_return_rate, (int, float))
-    assert isinstance(initial_capital, (int, float))
-    assert isinstance(monthly_savings, (int, float))
     assert isinstance(years, int)
 
     mortgage_down_payment = mortgage_apartment_price * mortgage_down_payment_rate
@@ -93,90 +98,94 @@ def compute_investment_property_model(
     etf_capital = initial_capital - mortgage_down_payment - mortgage_total_fees
 
     # Mortgage annuity model: fixed monthly payment until refinancing
-    loan_base = loan_outstanding
     fixed_monthly_payment = (
-        loan_base * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
-        if loan_base > 0
+        loan_outstanding * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+        if loan_outstanding > 0
         else 0.0
     )
 
     current_rental_income = rental_income_monthly
-    monthly_etf_rate = (1.0 + etf_yearly_return_rate) ** (1.0 / 12.0) - 1.0
+    # expm1/log1p form of (1 + r) ** (1 / 12) - 1; exact for small rates
+    monthly_etf_rate = expm1(log1p(etf_yearly_return_rate) / 12.0)
+
+    # Loop-invariant growth factors, bound once instead of re-evaluating
+    # `1.0 + rate` on every iteration
+    etf_factor = 1.0 + monthly_etf_rate
+    rental_growth = 1.0 + rental_income_yearly_increase_rate
+    monthly_interest_rate = mortgage_interest_rate / 12.0
+
+    # One float64 array per output column, filled by indexed assignment
+    # instead of appending per-row dicts.
+    # Property value for every year via one cumulative product instead of a
+    # pow call per year
+    n_rows = years + 1
+    property_growth = np.full(n_rows, 1.0 + yearly_apartment_raise_rate)
+    property_growth[0] = 1.0
+    property_values = mortgage_apartment_price * np.cumprod(property_growth)
+
+    columns = {
+        "total_loan": np.empty(n_rows, dtype=np.float64),
+        "property_value": property_values,
+        "property_equity": np.empty(n_rows, dtype=np.float64),
+        "etf_capital": np.empty(n_rows, dtype=np.float64),
+        "estimated_total_capital": np.empty(n_rows, dtype=np.float64),
+        "monthly_rental_income": np.empty(n_rows, dtype=np.float64),
+        "monthly_mortgage_payment": np.empty(n_rows, dtype=np.float64),
+        "monthly_interest_payment": np.empty(n_rows, dtype=np.float64),
+        "monthly_loan_repayment": np.empty(n_rows, dtype=np.float64),
+        "monthly_surplus": np.empty(n_rows, dtype=np.float64),
+        "monthly_savings": np.full(n_rows, monthly_savings, dtype=np.float64),
+    }
 
     # Year 0 row (initial state before any year passes)
     initial_surplus = current_rental_income - fixed_monthly_payment + monthly_savings
-    rows = [
-        {
-            "year": 0,
-            "total_loan": loan_outstanding,
-            "property_value": mortgage_apartment_price,
-            "property_equity": mortgage_apartment_price - loan_outstanding,
-            "etf_capital": etf_capital,
-            "estimated_total_capital": (mortgage_apartment_price - loan_outstanding) + etf_capital,
-            "monthly_rental_income": current_rental_income,
-            "monthly_mortgage_payment": fixed_monthly_payment,
-            "monthly_interest_payment": 0,
-            "monthly_loan_repayment": 0,
-            "monthly_surplus": initial_surplus,
-            "monthly_savings": monthly_savings,
-        }
-    ]
+    columns["total_loan"][0] = loan_outstanding
+    columns["etf_capital"][0] = etf_capital
+    columns["monthly_rental_income"][0] = current_rental_income
+    columns["monthly_mortgage_payment"][0] = fixed_monthly_payment
+    columns["monthly_interest_payment"][0] = 0.0
+    columns["monthly_loan_repayment"][0] = 0.0
+    columns["monthly_surplus"][0] = initial_surplus
 
     for year in range(1, years + 1):
-        # Property value grows yearly
-        property_value = mortgage_apartment_price * (1.0 + yearly_apartment_raise_rate) ** year
-
         # Track totals for reporting
         total_interest_paid_this_year = 0.0
         total_principal_paid_this_year = 0.0
 
+        # Monthly surplus: rental income - mortgage + savings; all three are
+        # constant within the year, so compute it once outside the months
+        monthly_surplus = current_rental_income - fixed_monthly_payment + monthly_savings
+
         # Monthly simulation
         for _ in range(12):
             # Interest calculated from current outstanding principal
-            monthly_interest_payment = loan_outstanding * mortgage_interest_rate / 12.0
+            monthly_interest_payment = loan_outstanding * monthly_interest_rate
             monthly_loan_repayment = fixed_monthly_payment - monthly_interest_payment
 
             total_interest_paid_this_year += monthly_interest_payment
             total_principal_paid_this_year += monthly_loan_repayment
 
-            # Monthly surplus: rental income - mortgage + savings
-            monthly_surplus = current_rental_income - fixed_monthly_payment + monthly_savings
-
             # Invest surplus into ETF (compound existing + add new)
-            etf_capital = etf_capital * (1.0 + monthly_etf_rate) + monthly_surplus
+            etf_capital = etf_capital * etf_factor + monthly_surplus
 
-            # Reduce loan outstanding
-            loan_outstanding -= monthly_loan_repayment
-            if loan_outstanding < 0:
-                loan_outstanding = 0
+            # Reduce loan outstanding; branchless clamp at payoff instead of
+            # a compare-and-reset the CPU cannot predict
+            loan_outstanding = max(loan_outstanding - monthly_loan_repayment, 0.0)
 
         # Average monthly values for reporting
         avg_monthly_interest = total_interest_paid_this_year / 12.0
         avg_monthly_repayment = total_principal_paid_this_year / 12.0
 
-        # Property equity and total capital
-        property_equity = property_value - loan_outstanding
-        estimated_total_capital = property_equity + etf_capital
-
-        rows.append(
-            {
-                "year": year,
-                "total_loan": loan_outstanding,
-                "property_value": property_value,
-                "property_equity": property_equity,
-                "etf_capital": etf_capital,
-                "estimated_total_capital": estimated_total_capital,
-                "monthly_rental_income": current_rental_income,
-                "monthly_mortgage_payment": fixed_monthly_payment,
-                "monthly_interest_payment": avg_monthly_interest,
-                "monthly_loan_repayment": avg_monthly_repayment,
-                "monthly_surplus": monthly_surplus,
-                "monthly_savings": monthly_savings,
-            }
-        )
+        columns["total_loan"][year] = loan_outstanding
+        columns["etf_capital"][year] = etf_capital
+        columns["monthly_rental_income"][year] = current_rental_income
+        columns["monthly_mortgage_payment"][year] = fixed_monthly_payment
+        columns["monthly_interest_payment"][year] = avg_monthly_interest
+        columns["monthly_loan_repayment"][year] = avg_monthly_repayment
+        columns["monthly_surplus"][year] = monthly_surplus
 
         # Prepare next year: rental income grows
-        current_rental_income *= 1.0 + rental_income_yearly_increase_rate
+        current_rental_income *= rental_growth
 
         # Recalculate fixed payment on refinancing schedule
         if (
@@ -184,12 +193,17 @@ def compute_investment_property_model(
             and mortgate_refinancing_years > 0
             and (year % mortgate_refinancing_years == 0)
         ):
-            loan_base = loan_outstanding
             fixed_monthly_payment = (
-                loan_base * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+                loan_outstanding * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
             )
 
-    return pd.DataFrame(rows)
+    # Equity and total capital are pure functions of columns already stored
+    # above, so derive them in two fused elementwise passes after the loop
+    # instead of scalar-per-year inside it
+    np.subtract(property_values, columns["total_loan"], out=columns["property_equity"])
+    np.add(columns["property_equity"], columns["etf_capital"], out=columns["estimated_total_capital"])
+
+    return pd.DataFrame({"year": np.arange(n_rows), **columns}, copy=False)
 
 
 def compute_etf_only_model(
@@ -211,30 +225,27 @@ def compute_etf_only_model(
     if years <= 0:
         raise ValueError("years must be > 0")
 
-    monthly_etf_rate = (1.0 + etf_yearly_return_rate) ** (1.0 / 12.0) - 1.0
+    monthly_etf_rate = expm1(log1p(etf_yearly_return_rate) / 12.0)
+    etf_factor = 1.0 + monthly_etf_rate
     etf_capital = initial_capital
 
-    rows = [
-        {
-            "year": 0,
-            "etf_capital": etf_capital,
-            "estimated_total_capital": etf_capital,
-            "monthly_savings": monthly_savings,
-        }
-    ]
+    n_rows = years + 1
+    etf_capital_arr = np.empty(n_rows, dtype=np.float64)
+    etf_capital_arr[0] = etf_capital
 
     for year in range(1, years + 1):
         # Monthly compounding with savings contributions
         for _ in range(12):
-            etf_capital = etf_capital * (1.0 + monthly_etf_rate) + monthly_savings
-
-        rows.append(
-            {
-                "year": year,
-                "etf_capital": etf_capital,
-                "estimated_total_capital": etf_capital,
-                "monthly_savings": monthly_savings,
-            }
-        )
+            etf_capital = etf_capital * etf_factor + monthly_savings
 
-    return pd.DataFrame(rows)
+        etf_capital_arr[year] = etf_capital
+
+    return pd.DataFrame(
+        {
+            "year": np.arange(n_rows),
+            "etf_capital": etf_capital_arr,
+            "estimated_total_capital": etf_capital_arr,
+            "monthly_savings": np.full(n_rows, monthly_savings, dtype=np.float64),
+        },
+        copy=False,
+    )
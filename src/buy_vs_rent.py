@@ -1,5 +1,634 @@
+from functools import lru_cache
+from math import expm1, log1p
+
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+# Optional Cython backend (see _buy_vs_rent_core.pyx); built with
+# `python setup.py build_ext --inplace`
+try:
+    from ._buy_vs_rent_core import simulate as _c_simulate
+except ImportError:
+    try:
+        from _buy_vs_rent_core import simulate as _c_simulate
+    except ImportError:
+        _c_simulate = None
+
+# Output columns of compute_finantial_model, in DataFrame order (after the
+# leading "year" column); also the second axis of the batched output cube.
+_COLUMNS = (
+    "total_loan",
+    "estimated_total_capital",
+    "monthly_interest_payment",
+    "monthly_loan_repayment",
+    "monthly_rent",
+    "monthly_apartment_spend",
+    "monthly_spending",
+    "monthly_income",
+    "monthly_leftover",
+    "invested_capital",
+    "etf_capital",
+    "etf_capital_after_tax",
+    "spending_not_covered_by_3_percent_etf",
+    "property_value",
+    "property_equity",
+    "yearly_sondertilgung",
+    "cumulative_interest_paid",
+)
+
+# DataFrame column order; the leading year index shares the float64 block
+# with the simulated columns so each result is one consolidated block
+_FRAME_COLUMNS = ("year",) + _COLUMNS
+
+
+@lru_cache(maxsize=1024)
+def _monthly_rate(annual: float) -> float:
+    """Yearly rate compounded down to its monthly equivalent.
+
+    expm1(log1p(r) / 12) avoids the cancellation that
+    (1 + r) ** (1 / 12) - 1 suffers for small r, and the cache lets sweeps
+    that reuse the same nominal rates skip the transcendentals.
+    """
+    return expm1(log1p(annual) / 12.0)
+
+
+def _geometric_sum(ratio: float, n: int) -> float:
+    """Sum of ratio**k for k in range(n)."""
+    if abs(ratio - 1.0) < 1e-12:
+        return float(n)
+    return (ratio ** n - 1.0) / (ratio - 1.0)
+
+
+def _mixed_geometric_sum(r: float, g: float, n: int) -> float:
+    """Sum of g**k * r**(n - 1 - k) for k in range(n)."""
+    if abs(r - g) < 1e-12:
+        return n * r ** (n - 1)
+    return (r ** n - g ** n) / (r - g)
+
+
+def _simulate(
+    yearly_inflation_rate,
+    yearly_apartment_raise_rate,
+    mortgage_apartment_price,
+    mortgage_interest_rate,
+    mortgage_yearly_repayment_rate,
+    mortgate_refinancing_years,
+    etf_yearly_return_rate,
+    cold_rent_monthly_cost,
+    cold_rent_yearly_increase_rate,
+    initial_cash,
+    initial_loan,
+    monthly_net_income,
+    monthly_spending,
+    yearly_income_increase_rate,
+    years,
+    sondertilgung_yearly_rate,
+    etf_tax_rate,
+    total_loan,
+    estimated_total_capital,
+    monthly_interest_payment_out,
+    monthly_loan_repayment_out,
+    monthly_rent_out,
+    monthly_apartment_spend_out,
+    monthly_spending_out,
+    monthly_income_out,
+    monthly_leftover_out,
+    invested_capital_out,
+    etf_capital_out,
+    etf_capital_after_tax_out,
+    spending_not_covered_out,
+    property_value_out,
+    property_equity_out,
+    yearly_sondertilgung_out,
+    cumulative_interest_paid_out,
+):
+    """Scalar simulation kernel filling rows 1..years of the output arrays.
+
+    Pure float/int arithmetic over preallocated arrays so that Numba can
+    lower it to machine code; the Python wrapper owns validation and the
+    DataFrame construction.
+    """
+    loan_outstanding = initial_loan
+    invested_capital = initial_cash
+    etf_capital = initial_cash
+    etf_cost_basis = initial_cash
+
+    # Mortgage annuity model: fixed monthly payment until refinancing.
+    # Each month: interest is calculated from current loan_outstanding,
+    # principal repayment = fixed_payment - interest.
+    # fixed_monthly_payment is reset from the outstanding balance on
+    # refinancing years.
+    fixed_monthly_payment = loan_outstanding * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+
+    current_monthly_income = monthly_net_income
+    current_monthly_rent = cold_rent_monthly_cost
+    current_monthly_spending = monthly_spending
+
+    # expm1/log1p form of (1 + r) ** (1 / 12) - 1; exact for small rates
+    monthly_inflation_rate = expm1(log1p(yearly_inflation_rate) / 12.0)
+    monthly_etf_rate = expm1(log1p(etf_yearly_return_rate) / 12.0)
+
+    max_sondertilgung = loan_outstanding * sondertilgung_yearly_rate
+    sondertilgung_monthly_reserve = max_sondertilgung / 12.0
+    cumulative_interest_paid = 0.0
+
+    # Within a year income, rent and the annuity payment are constant, so the
+    # 12 monthly updates collapse to geometric-series closed forms in these
+    # ratios (O(1) per year instead of 12 interpreted iterations). All growth
+    # bases, 12-month powers and series sums are loop-invariant, so they are
+    # computed once here; property value advances by one multiplication per
+    # year instead of a pow call.
+    monthly_interest_rate = mortgage_interest_rate / 12.0
+    annuity_payment_rate = (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+    apt_growth = 1.0 + yearly_apartment_raise_rate
+    income_growth = 1.0 + yearly_income_increase_rate
+    rent_growth = 1.0 + cold_rent_yearly_increase_rate
+    r = 1.0 + monthly_etf_rate
+    g = 1.0 + monthly_inflation_rate
+    q = 1.0 + monthly_interest_rate
+    r12 = r ** 12
+    g11 = g ** 11
+    g12 = g11 * g
+    q12 = q ** 12
+    gs_r = _geometric_sum(r, 12)
+    gs_g = _geometric_sum(g, 12)
+    gs_q = _geometric_sum(q, 12)
+    mixed_rg = _mixed_geometric_sum(r, g, 12)
+
+    property_value = mortgage_apartment_price
+
+    for year in range(1, years + 1):
+        # Property value grows with inflation as a proxy
+        property_value *= apt_growth
+
+        # Loan balance after 12 unclamped annuity months; if this goes
+        # non-positive the loan is repaid mid-year and the closed forms for
+        # the mortgage no longer hold.
+        if loan_outstanding > 0:
+            loan_after = loan_outstanding * q12 - fixed_monthly_payment * gs_q
+        else:
+            loan_after = 0.0
+
+        if loan_outstanding > 0 and loan_after <= 0.0:
+            # Payoff year: simulate only the months that still carry the
+            # loan explicitly; once it is repaid the rest of the year has no
+            # mortgage flows and collapses to the loan-free closed forms.
+            total_interest_paid_this_year = 0.0
+            total_principal_paid_this_year = 0.0
+            total_monthly_spending_this_year = 0.0
+            monthly_leftover = 0.0
+            leftover_sum = 0.0
+            months_with_loan = 0
+
+            while loan_outstanding > 0 and months_with_loan < 12:
+                monthly_interest_payment = loan_outstanding * monthly_interest_rate
+                monthly_loan_repayment = min(
+                    fixed_monthly_payment - monthly_interest_payment,
+                    loan_outstanding,
+                )
+                actual_mortgage_payment = monthly_interest_payment + monthly_loan_repayment
+                # Branchless clamp at payoff; max lowers to a single maxsd
+                loan_outstanding = max(loan_outstanding - monthly_loan_repayment, 0.0)
+                if loan_outstanding <= 0.0:
+                    fixed_monthly_payment = 0.0
+                months_with_loan += 1
+
+                total_interest_paid_this_year += monthly_interest_payment
+                total_principal_paid_this_year += monthly_loan_repayment
+                total_monthly_spending_this_year += current_monthly_spending
+
+                monthly_apartment_spend = current_monthly_rent + actual_mortgage_payment
+
+                monthly_leftover = (
+                    current_monthly_income
+                    - monthly_apartment_spend
+                    - current_monthly_spending
+                )
+                leftover_sum += monthly_leftover
+                etf_capital = etf_capital * r + monthly_leftover - sondertilgung_monthly_reserve
+                current_monthly_spending *= g
+
+            reserved_sum = months_with_loan * sondertilgung_monthly_reserve
+
+            remaining_months = 12 - months_with_loan
+            if remaining_months > 0:
+                spend_sum = current_monthly_spending * _geometric_sum(g, remaining_months)
+                total_monthly_spending_this_year += spend_sum
+                leftover_const = current_monthly_income - current_monthly_rent
+                etf_capital = (
+                    etf_capital * r ** remaining_months
+                    + leftover_const * _geometric_sum(r, remaining_months)
+                    - current_monthly_spending * _mixed_geometric_sum(r, g, remaining_months)
+                )
+                leftover_sum += remaining_months * leftover_const - spend_sum
+                monthly_leftover = (
+                    leftover_const - current_monthly_spending * g ** (remaining_months - 1)
+                )
+                current_monthly_spending *= g ** remaining_months
+
+            # Uncompounded totals only need one update per year: invested
+            # capital is the accumulated leftover, and the ETF cost basis is
+            # the same minus what was reserved for sondertilgung
+            invested_capital += leftover_sum
+            etf_cost_basis += leftover_sum - reserved_sum
+        else:
+            # Regular year: the loan stays on the annuity schedule (or is
+            # already fully repaid), so every monthly quantity is a geometric
+            # series in r, g or q.
+            if loan_outstanding > 0:
+                actual_mortgage_payment = fixed_monthly_payment
+                current_sondertilgung_reserve = sondertilgung_monthly_reserve
+                total_principal_paid_this_year = loan_outstanding - loan_after
+                total_interest_paid_this_year = (
+                    12.0 * fixed_monthly_payment - total_principal_paid_this_year
+                )
+                loan_outstanding = loan_after
+            else:
+                actual_mortgage_payment = 0.0
+                current_sondertilgung_reserve = 0.0
+                total_principal_paid_this_year = 0.0
+                total_interest_paid_this_year = 0.0
+
+            # Spending starts at current_monthly_spending and grows by g each
+            # month; leftover is the constant part minus that growing spending.
+            total_monthly_spending_this_year = current_monthly_spending * gs_g
+            monthly_apartment_spend = current_monthly_rent + actual_mortgage_payment
+            leftover_const = current_monthly_income - monthly_apartment_spend
+            contribution_const = leftover_const - current_sondertilgung_reserve
+
+            etf_capital = (
+                etf_capital * r12
+                + contribution_const * gs_r
+                - current_monthly_spending * mixed_rg
+            )
+            invested_delta = 12.0 * leftover_const - total_monthly_spending_this_year
+            invested_capital += invested_delta
+            etf_cost_basis += invested_delta - 12.0 * current_sondertilgung_reserve
+
+            # Last month's leftover, reported below
+            monthly_leftover = leftover_const - current_monthly_spending * g11
+            current_monthly_spending *= g12
+
+        # Apply sondertilgung at year end
+        actual_sondertilgung = 0.0
+        if loan_outstanding > 0 and max_sondertilgung > 0:
+            actual_sondertilgung = min(max_sondertilgung, loan_outstanding)
+            loan_outstanding -= actual_sondertilgung
+            if loan_outstanding <= 0:
+                loan_outstanding = 0.0
+                fixed_monthly_payment = 0.0
+
+        cumulative_interest_paid += total_interest_paid_this_year
+
+        # Average monthly values for reporting
+        avg_monthly_interest = total_interest_paid_this_year / 12.0
+        avg_monthly_repayment = total_principal_paid_this_year / 12.0
+        avg_monthly_spending = total_monthly_spending_this_year / 12.0
+        monthly_apartment_spend = current_monthly_rent + fixed_monthly_payment
+
+        # ETF after tax: tax only on gains, not on cost basis
+        etf_gain = max(0.0, etf_capital - etf_cost_basis)
+        etf_capital_after_tax = etf_capital - etf_gain * etf_tax_rate
+
+        # Estimated total capital = invested capital + property equity
+        property_equity = property_value - loan_outstanding
+        estimated_total_capital[year] = property_equity + etf_capital_after_tax
+
+        total_loan[year] = loan_outstanding
+        monthly_interest_payment_out[year] = avg_monthly_interest
+        monthly_loan_repayment_out[year] = avg_monthly_repayment
+        monthly_rent_out[year] = current_monthly_rent
+        monthly_apartment_spend_out[year] = monthly_apartment_spend
+        monthly_spending_out[year] = current_monthly_spending
+        monthly_income_out[year] = current_monthly_income
+        monthly_leftover_out[year] = monthly_leftover
+        invested_capital_out[year] = invested_capital
+        etf_capital_out[year] = etf_capital
+        etf_capital_after_tax_out[year] = etf_capital_after_tax
+        spending_not_covered_out[year] = (
+            (avg_monthly_spending + monthly_apartment_spend)
+            - (etf_capital_after_tax * 3 / 100) / 12
+        )
+        property_value_out[year] = property_value
+        property_equity_out[year] = property_equity
+        yearly_sondertilgung_out[year] = actual_sondertilgung
+        cumulative_interest_paid_out[year] = cumulative_interest_paid
+
+        # Prepare next year values (income/rent growth and possible refinancing)
+        current_monthly_income *= income_growth
+        current_monthly_rent *= rent_growth
+
+        # Recalculate loan base and fixed payment on refinancing schedule
+        if (
+            loan_outstanding > 0
+            and mortgate_refinancing_years > 0
+            and (year % mortgate_refinancing_years == 0)
+        ):
+            fixed_monthly_payment = loan_outstanding * annuity_payment_rate
+
+
+def _simulate_batch(params, refinancing_years, years, out):
+    """Run _simulate for every scenario row of `params`.
+
+    `params` has one row per scenario holding the 15 float parameters of
+    _simulate in positional order (the two int parameters travel separately
+    in `refinancing_years` and `years`); `out` is a (n_scenarios,
+    len(_FRAME_COLUMNS), years + 1) cube whose slice rows follow
+    _FRAME_COLUMNS (row 0 is the year index, filled by the caller) and
+    whose years 1..years each scenario fills. Each scenario writes only its
+    own slice, so prange needs no locking and sweeps scale across cores.
+    """
+    for i in prange(params.shape[0]):
+        _simulate(
+            params[i, 0],
+            params[i, 1],
+            params[i, 2],
+            params[i, 3],
+            params[i, 4],
+            refinancing_years[i],
+            params[i, 5],
+            params[i, 6],
+            params[i, 7],
+            params[i, 8],
+            params[i, 9],
+            params[i, 10],
+            params[i, 11],
+            params[i, 12],
+            years,
+            params[i, 13],
+            params[i, 14],
+            out[i, 1],
+            out[i, 2],
+            out[i, 3],
+            out[i, 4],
+            out[i, 5],
+            out[i, 6],
+            out[i, 7],
+            out[i, 8],
+            out[i, 9],
+            out[i, 10],
+            out[i, 11],
+            out[i, 12],
+            out[i, 13],
+            out[i, 14],
+            out[i, 15],
+            out[i, 16],
+            out[i, 17],
+        )
+
+
+if njit is not None:
+    # Explicit signature so the kernels are compiled at import time rather
+    # than on the first call; cache=True keeps the compiled code across
+    # sessions.
+    _geometric_sum = njit("float64(float64, int64)", cache=True, fastmath=True)(_geometric_sum)
+    _mixed_geometric_sum = njit("float64(float64, float64, int64)", cache=True, fastmath=True)(_mixed_geometric_sum)
+    _simulate = njit(
+        "void(" + "float64, " * 5 + "int64, " + "float64, " * 8 + "int64, "
+        + "float64, " * 2 + "float64[::1], " * 16 + "float64[::1])",
+        cache=True,
+        fastmath=True,
+    )(_simulate)
+    _simulate_batch = njit(
+        "void(float64[:, ::1], int64[::1], int64, float64[:, :, ::1])",
+        cache=True,
+        fastmath=True,
+        parallel=True,
+    )(_simulate_batch)
+
+
+def _cumulative_powers(base, n, shifted=False):
+    """base**k for k in 1..n (or 0..n-1 when shifted) via one cumprod.
+
+    n multiplications total instead of n libm pow calls.
+    """
+    factors = np.full(n, base)
+    if shifted:
+        factors[0] = 1.0
+    return np.cumprod(factors)
+
+
+def _simulate_vectorized(
+    yearly_inflation_rate,
+    yearly_apartment_raise_rate,
+    mortgage_apartment_price,
+    mortgage_interest_rate,
+    mortgage_yearly_repayment_rate,
+    mortgate_refinancing_years,
+    etf_yearly_return_rate,
+    cold_rent_monthly_cost,
+    cold_rent_yearly_increase_rate,
+    initial_cash,
+    initial_loan,
+    monthly_net_income,
+    monthly_spending,
+    yearly_income_increase_rate,
+    years,
+    sondertilgung_yearly_rate,
+    etf_tax_rate,
+    total_loan,
+    estimated_total_capital,
+    monthly_interest_payment_out,
+    monthly_loan_repayment_out,
+    monthly_rent_out,
+    monthly_apartment_spend_out,
+    monthly_spending_out,
+    monthly_income_out,
+    monthly_leftover_out,
+    invested_capital_out,
+    etf_capital_out,
+    etf_capital_after_tax_out,
+    spending_not_covered_out,
+    property_value_out,
+    property_equity_out,
+    yearly_sondertilgung_out,
+    cumulative_interest_paid_out,
+):
+    """NumPy fast path for the no-refinancing, no-sondertilgung case.
+
+    Without refinancing the annuity payment is constant, so every per-year
+    quantity is a closed-form function of the year index and the whole
+    simulation becomes array expressions over np.arange(1, years + 1): power
+    series for prices/rent/income/loan balance and a cumulative scan for the
+    ETF recurrence. Only the single year in which the loan is repaid mid-year
+    (where the repayment clamp kicks in) is simulated month-by-month. Used
+    instead of _simulate when numba is not installed; fills the same output
+    arrays.
+    """
+    monthly_inflation_rate = _monthly_rate(yearly_inflation_rate)
+    monthly_etf_rate = _monthly_rate(etf_yearly_return_rate)
+    r = 1.0 + monthly_etf_rate
+    g = 1.0 + monthly_inflation_rate
+    q = 1.0 + mortgage_interest_rate / 12.0
+
+    yrs = np.arange(1, years + 1)
+    property_value = mortgage_apartment_price * _cumulative_powers(1.0 + yearly_apartment_raise_rate, years)
+    rent = cold_rent_monthly_cost * _cumulative_powers(1.0 + cold_rent_yearly_increase_rate, years, shifted=True)
+    income = monthly_net_income * _cumulative_powers(1.0 + yearly_income_increase_rate, years, shifted=True)
+    spending_start = monthly_spending * _cumulative_powers(g ** 12, years, shifted=True)
+
+    fixed_monthly_payment = initial_loan * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+
+    # Unclamped annuity balance at each year end; the first non-positive
+    # entry marks the payoff year.
+    q_powers = _cumulative_powers(q ** 12, years)
+    if abs(q - 1.0) < 1e-12:
+        annuity_sum = (12 * yrs).astype(np.float64)
+    else:
+        annuity_sum = (q_powers - 1.0) / (q - 1.0)
+    loan_unclamped = initial_loan * q_powers - fixed_monthly_payment * annuity_sum
+
+    if initial_loan <= 0.0:
+        payoff_year = 0
+    elif (loan_unclamped <= 0.0).any():
+        payoff_year = int(np.argmax(loan_unclamped <= 0.0)) + 1
+    else:
+        payoff_year = years + 1
+
+    pre_payoff = yrs < payoff_year
+    loan_end = np.where(pre_payoff, loan_unclamped, 0.0)
+    loan_start = np.concatenate(([initial_loan], loan_end[:-1]))
+    principal = np.where(pre_payoff, loan_start - loan_end, 0.0)
+    interest = np.where(pre_payoff, 12.0 * fixed_monthly_payment - principal, 0.0)
+    # Payment made during the year vs annuity payment left at year end
+    # (zero from the payoff year on); both constant per year.
+    pay = np.where(pre_payoff, fixed_monthly_payment, 0.0)
+    fixed_end = np.where(yrs < payoff_year, fixed_monthly_payment, 0.0)
+
+    gs_r = _geometric_sum(r, 12)
+    gs_g = _geometric_sum(g, 12)
+    mixed = _mixed_geometric_sum(r, g, 12)
+
+    spending_total = spending_start * gs_g
+    leftover_const = income - rent - pay
+    etf_contribution = leftover_const * gs_r - spending_start * mixed
+    invested_delta = 12.0 * leftover_const - spending_total
+    leftover_last = leftover_const - spending_start * g ** 11
+
+    if 1 <= payoff_year <= years:
+        # Single payoff year: the repayment clamp breaks the closed forms,
+        # so simulate its 12 months explicitly. The ETF update is linear in
+        # the starting capital, so accumulating from zero yields this year's
+        # additive contribution for the cumulative scan below.
+        idx = payoff_year - 1
+        loan_outstanding = loan_start[idx]
+        current_monthly_spending = spending_start[idx]
+        year_income = income[idx]
+        year_rent = rent[idx]
+        fixed_payment = fixed_monthly_payment
+        interest_sum = 0.0
+        principal_sum = 0.0
+        leftover_sum = 0.0
+        etf_linear = 0.0
+        monthly_leftover = 0.0
+        for _ in range(12):
+            if loan_outstanding > 0:
+                monthly_interest_payment = loan_outstanding * mortgage_interest_rate / 12.0
+                monthly_loan_repayment = min(
+                    fixed_payment - monthly_interest_payment,
+                    loan_outstanding,
+                )
+                actual_mortgage_payment = monthly_interest_payment + monthly_loan_repayment
+                loan_outstanding = max(loan_outstanding - monthly_loan_repayment, 0.0)
+                if loan_outstanding <= 0.0:
+                    fixed_payment = 0.0
+            else:
+                monthly_interest_payment = 0.0
+                monthly_loan_repayment = 0.0
+                actual_mortgage_payment = 0.0
+            interest_sum += monthly_interest_payment
+            principal_sum += monthly_loan_repayment
+            monthly_leftover = (
+                year_income - year_rent - actual_mortgage_payment - current_monthly_spending
+            )
+            leftover_sum += monthly_leftover
+            etf_linear = etf_linear * r + monthly_leftover
+            current_monthly_spending *= g
+        loan_end[idx] = loan_outstanding
+        principal[idx] = principal_sum
+        interest[idx] = interest_sum
+        etf_contribution[idx] = etf_linear
+        invested_delta[idx] = leftover_sum
+        leftover_last[idx] = monthly_leftover
+
+    # ETF recurrence E_y = E_{y-1} * r**12 + C_y solved with a cumulative
+    # scan; invested capital and the cost basis are plain cumulative sums
+    # (without sondertilgung every leftover goes into the ETF).
+    etf_growth = _cumulative_powers(r ** 12, years)
+    etf_capital = etf_growth * (initial_cash + np.cumsum(etf_contribution / etf_growth))
+    invested_capital = initial_cash + np.cumsum(invested_delta)
+    etf_cost_basis = invested_capital
+    etf_gain = np.maximum(0.0, etf_capital - etf_cost_basis)
+    etf_capital_after_tax = etf_capital - etf_gain * etf_tax_rate
+
+    monthly_apartment_spend = rent + fixed_end
+    property_equity = property_value - loan_end
+
+    total_loan[1:] = loan_end
+    estimated_total_capital[1:] = property_equity + etf_capital_after_tax
+    monthly_interest_payment_out[1:] = interest / 12.0
+    monthly_loan_repayment_out[1:] = principal / 12.0
+    monthly_rent_out[1:] = rent
+    monthly_apartment_spend_out[1:] = monthly_apartment_spend
+    monthly_spending_out[1:] = spending_start * g ** 12
+    monthly_income_out[1:] = income
+    monthly_leftover_out[1:] = leftover_last
+    invested_capital_out[1:] = invested_capital
+    etf_capital_out[1:] = etf_capital
+    etf_capital_after_tax_out[1:] = etf_capital_after_tax
+    spending_not_covered_out[1:] = (
+        (spending_total / 12.0 + monthly_apartment_spend)
+        - (etf_capital_after_tax * 3 / 100) / 12
+    )
+    property_value_out[1:] = property_value
+    property_equity_out[1:] = property_equity
+    yearly_sondertilgung_out[1:] = 0.0
+    cumulative_interest_paid_out[1:] = np.cumsum(interest)
+
+
+def _fill_initial_row(
+    columns,
+    cold_rent_monthly_cost,
+    initial_capital,
+    initial_cash,
+    monthly_net_income,
+    monthly_spending,
+):
+    """Write the year-0 row (initial state before any year passes).
+
+    `columns` maps column names to arrays whose last axis is the year, so
+    the same direct indexed assignments serve both the single-scenario
+    wrapper (1-D columns, scalar parameters) and the batched wrapper
+    (per-scenario views, array parameters).
+    """
+    columns["total_loan"][..., 0] = 0.0
+    columns["estimated_total_capital"][..., 0] = initial_capital
+    columns["monthly_interest_payment"][..., 0] = 0.0
+    columns["monthly_loan_repayment"][..., 0] = 0.0
+    columns["monthly_rent"][..., 0] = cold_rent_monthly_cost
+    columns["monthly_apartment_spend"][..., 0] = cold_rent_monthly_cost
+    columns["monthly_spending"][..., 0] = monthly_spending
+    columns["monthly_income"][..., 0] = monthly_net_income
+    columns["monthly_leftover"][..., 0] = (
+        monthly_net_income - monthly_spending - cold_rent_monthly_cost
+    )
+    columns["invested_capital"][..., 0] = initial_capital
+    columns["etf_capital"][..., 0] = initial_cash
+    columns["etf_capital_after_tax"][..., 0] = initial_cash
+    columns["spending_not_covered_by_3_percent_etf"][..., 0] = (
+        (monthly_spending + cold_rent_monthly_cost) - (initial_cash * 3 / 100) / 12
+    )
+    columns["property_value"][..., 0] = 0.0
+    columns["property_equity"][..., 0] = 0.0
+    columns["yearly_sondertilgung"][..., 0] = 0.0
+    columns["cumulative_interest_paid"][..., 0] = 0.0
+
 
 def compute_finantial_model(
     yearly_inflation_rate: float,
@@ -38,25 +667,27 @@ def compute_finantial_model(
       etf_capital_after_tax (etf_capital itself stays gross for simulation continuity)
     """
 
-    # Type assertions
-    assert isinstance(yearly_inflation_rate, (int, float))
-    assert isinstance(yearly_apartment_raise_rate, (int, float))
-    assert isinstance(mortgage_apartment_price, (int, float))
-    assert isinstance(mortgage_interest_rate, (int, float))
-    assert isinstance(mortgage_down_payment_rate, (int, float))
-    assert isinstance(mortgage_total_fees_rate, (int, float))
-    assert isinstance(mortgage_yearly_repayment_rate, (int, float))
+    # Normalize the numeric parameters once: float() both rejects
+    # non-numeric input and keeps all downstream arithmetic on the C-level
+    # float fast path (no int/float promotion in the kernels)
+    yearly_inflation_rate = float(yearly_inflation_rate)
+    yearly_apartment_raise_rate = float(yearly_apartment_raise_rate)
+    mortgage_apartment_price = float(mortgage_apartment_price)
+    mortgage_interest_rate = float(mortgage_interest_rate)
+    mortgage_down_payment_rate = float(mortgage_down_payment_rate)
+    mortgage_total_fees_rate = float(mortgage_total_fees_rate)
+    mortgage_yearly_repayment_rate = float(mortgage_yearly_repayment_rate)
+    etf_yearly_return_rate = float(etf_yearly_return_rate)
+    cold_rent_monthly_cost = float(cold_rent_monthly_cost)
+    cold_rent_yearly_increase_rate = float(cold_rent_yearly_increase_rate)
+    initial_capital = float(initial_capital)
+    monthly_net_income = float(monthly_net_income)
+    monthly_spending = float(monthly_spending)
+    yearly_income_increase_rate = float(yearly_income_increase_rate)
+    sondertilgung_yearly_rate = float(sondertilgung_yearly_rate)
+    etf_tax_rate = float(etf_tax_rate)
     assert isinstance(mortgate_refinancing_years, int)
-    assert isinstance(etf_yearly_return_rate, (int, float))
-    assert isinstance(cold_rent_monthly_cost, (int, float))
-    assert isinstance(cold_rent_yearly_increase_rate, (int, float))
-    assert isinstance(initial_capital, (int, float))
-    assert isinstance(monthly_net_income, (int, float))
-    assert isinstance(monthly_spending, (int, float))
-    assert isinstance(yearly_income_increase_rate, (int, float))
     assert isinstance(years, int)
-    assert isinstance(sondertilgung_yearly_rate, (int, float))
-    assert isinstance(etf_tax_rate, (int, float))
 
     mortgage_down_payment = mortgage_apartment_price * mortgage_down_payment_rate
     mortgage_total_fees = mortgage_apartment_price * mortgage_total_fees_rate
@@ -108,162 +739,423 @@ def compute_finantial_model(
     assert loan_outstanding >= 0, "loan_outstanding must be >= 0"
 
     # Down payment and fees are assumed to be paid from initial capital upfront
-    invested_capital = initial_capital - mortgage_down_payment - mortgage_total_fees
-    etf_capital = initial_capital - mortgage_down_payment - mortgage_total_fees
-    etf_cost_basis = etf_capital
+    initial_cash = initial_capital - mortgage_down_payment - mortgage_total_fees
 
     # Guard: if initial capital cannot cover down payment and fees, allow negative cash
     # (represents borrowing from other sources). Keep the model simple and explicit.
 
-    # Mortgage annuity model: fixed monthly payment until refinancing.
-    # Each month: interest is calculated from current loan_outstanding,
-    # principal repayment = fixed_payment - interest.
-    # Base and fixed_monthly_payment are reset on refinancing years.
-    loan_base = loan_outstanding
-    fixed_monthly_payment = loan_base * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+    # One (n_columns, n_rows) float64 allocation: each contiguous row is an
+    # output column filled in-place by the kernel, and the transpose backs
+    # the DataFrame as a single consolidated block without copying.
+    n_rows = years + 1
+    data = np.empty((len(_FRAME_COLUMNS), n_rows), dtype=np.float64)
+    data[0] = np.arange(n_rows)
+    columns = {name: data[j + 1] for j, name in enumerate(_COLUMNS)}
 
-    current_monthly_income = monthly_net_income
-    current_monthly_rent = cold_rent_monthly_cost
-    current_monthly_spending = monthly_spending
+    _fill_initial_row(
+        columns,
+        cold_rent_monthly_cost,
+        initial_capital,
+        initial_cash,
+        monthly_net_income,
+        monthly_spending,
+    )
 
-    monthly_inflation_rate = (1.0 + yearly_inflation_rate) ** (1.0 / 12.0) - 1.0
-    monthly_etf_rate = (1.0 + etf_yearly_return_rate) ** (1.0 / 12.0) - 1.0
+    if _c_simulate is not None:
+        # Compiled C extension: no per-call dispatch overhead at all
+        simulate = _c_simulate
+    elif (
+        njit is None
+        and sondertilgung_yearly_rate == 0
+        and (mortgate_refinancing_years == 0 or mortgate_refinancing_years > years)
+    ):
+        # Without numba the scalar kernel runs as plain Python; take the
+        # vectorized fast path whenever its preconditions hold.
+        simulate = _simulate_vectorized
+    else:
+        simulate = _simulate
+    simulate(
+        yearly_inflation_rate,
+        yearly_apartment_raise_rate,
+        mortgage_apartment_price,
+        mortgage_interest_rate,
+        mortgage_yearly_repayment_rate,
+        mortgate_refinancing_years,
+        etf_yearly_return_rate,
+        cold_rent_monthly_cost,
+        cold_rent_yearly_increase_rate,
+        initial_cash,
+        loan_outstanding,
+        monthly_net_income,
+        monthly_spending,
+        yearly_income_increase_rate,
+        years,
+        sondertilgung_yearly_rate,
+        etf_tax_rate,
+        columns["total_loan"],
+        columns["estimated_total_capital"],
+        columns["monthly_interest_payment"],
+        columns["monthly_loan_repayment"],
+        columns["monthly_rent"],
+        columns["monthly_apartment_spend"],
+        columns["monthly_spending"],
+        columns["monthly_income"],
+        columns["monthly_leftover"],
+        columns["invested_capital"],
+        columns["etf_capital"],
+        columns["etf_capital_after_tax"],
+        columns["spending_not_covered_by_3_percent_etf"],
+        columns["property_value"],
+        columns["property_equity"],
+        columns["yearly_sondertilgung"],
+        columns["cumulative_interest_paid"],
+    )
 
-    max_sondertilgung = loan_outstanding * sondertilgung_yearly_rate
-    sondertilgung_monthly_reserve = max_sondertilgung / 12.0
-    cumulative_interest_paid = 0.0
+    return pd.DataFrame(data.T, columns=list(_FRAME_COLUMNS), copy=False)
+
+
+def compute_finantial_model_batch(
+    yearly_inflation_rate,
+    yearly_apartment_raise_rate,
+    mortgage_apartment_price,
+    mortgage_interest_rate,
+    mortgage_down_payment_rate,
+    mortgage_total_fees_rate,
+    mortgage_yearly_repayment_rate,
+    mortgate_refinancing_years,
+    etf_yearly_return_rate,
+    cold_rent_monthly_cost,
+    cold_rent_yearly_increase_rate,
+    initial_capital,
+    monthly_net_income,
+    monthly_spending,
+    yearly_income_increase_rate,
+    years: int,
+    sondertilgung_yearly_rate=0.0,
+    etf_tax_rate=0.0,
+) -> list:
+    """
+    Compute compute_finantial_model for many scenarios in one call.
+
+    Every parameter except `years` accepts either a scalar or a 1-D array;
+    array parameters are broadcast against each other (NumPy rules), so
+    sweeping e.g. mortgage_interest_rate over a grid runs one compiled
+    kernel call per scenario instead of a full Python-level simulation.
 
-    initial_etf = initial_capital - mortgage_down_payment - mortgage_total_fees
-    rows = [
-            {
-                "year": 0,
-                "total_loan": 0,
-                "estimated_total_capital": initial_capital,
-                "monthly_interest_payment": 0,
-                "monthly_loan_repayment": 0,
-                "monthly_rent": current_monthly_rent,
-                "monthly_apartment_spend": current_monthly_rent,
-                "monthly_spending": current_monthly_spending,
-                "monthly_income": current_monthly_income,
-                "monthly_leftover": current_monthly_income - current_monthly_spending - current_monthly_rent,
-                "invested_capital": initial_capital,
-                "etf_capital": initial_etf,
-                "etf_capital_after_tax": initial_etf,
-                "spending_not_covered_by_3_percent_etf": (current_monthly_spending + current_monthly_rent) - (initial_etf * 3 / 100) / 12,
-                "property_value": 0,
-                "property_equity": 0,
-                "yearly_sondertilgung": 0,
-                "cumulative_interest_paid": 0,
-            }
+    Returns a list with one DataFrame per scenario, each identical to what
+    compute_finantial_model would return for the corresponding parameters.
+    """
+    assert isinstance(years, int)
+    if years <= 0:
+        raise ValueError("years must be > 0")
+
+    mortgate_refinancing_years = np.asarray(mortgate_refinancing_years)
+    assert np.issubdtype(mortgate_refinancing_years.dtype, np.integer)
+    broadcast = np.broadcast_arrays(
+        mortgate_refinancing_years.astype(np.int64),
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (
+                yearly_inflation_rate,
+                yearly_apartment_raise_rate,
+                mortgage_apartment_price,
+                mortgage_interest_rate,
+                mortgage_down_payment_rate,
+                mortgage_total_fees_rate,
+                mortgage_yearly_repayment_rate,
+                etf_yearly_return_rate,
+                cold_rent_monthly_cost,
+                cold_rent_yearly_increase_rate,
+                initial_capital,
+                monthly_net_income,
+                monthly_spending,
+                yearly_income_increase_rate,
+                sondertilgung_yearly_rate,
+                etf_tax_rate,
+            )
+        ),
+    )
+    (
+        mortgate_refinancing_years,
+        yearly_inflation_rate,
+        yearly_apartment_raise_rate,
+        mortgage_apartment_price,
+        mortgage_interest_rate,
+        mortgage_down_payment_rate,
+        mortgage_total_fees_rate,
+        mortgage_yearly_repayment_rate,
+        etf_yearly_return_rate,
+        cold_rent_monthly_cost,
+        cold_rent_yearly_increase_rate,
+        initial_capital,
+        monthly_net_income,
+        monthly_spending,
+        yearly_income_increase_rate,
+        sondertilgung_yearly_rate,
+        etf_tax_rate,
+    ) = (np.atleast_1d(value) for value in broadcast)
+
+    mortgage_down_payment = mortgage_apartment_price * mortgage_down_payment_rate
+    mortgage_total_fees = mortgage_apartment_price * mortgage_total_fees_rate
+
+    # Value validations, mirroring compute_finantial_model per scenario
+    if np.any(mortgage_apartment_price < 0):
+        raise ValueError("mortgage_apartment_price must be >= 0")
+    if np.any(mortgage_down_payment < 0):
+        raise ValueError("mortgage_down_payment must be >= 0")
+    if np.any(mortgage_total_fees < 0):
+        raise ValueError("mortgage_total_fees must be >= 0")
+    if np.any(mortgage_down_payment > mortgage_apartment_price):
+        raise ValueError("mortgage_down_payment cannot exceed mortgage_apartment_price")
+    if np.any(initial_capital < mortgage_down_payment + mortgage_total_fees):
+        raise ValueError(
+            "initial_capital is insufficient to cover down payment and fees"
+        )
+    if np.any(mortgage_interest_rate < 0):
+        raise ValueError("mortgage_interest_rate must be >= 0")
+    if np.any(mortgage_yearly_repayment_rate < 0):
+        raise ValueError("mortgage_yearly_repayment_rate must be >= 0")
+    if np.any(etf_yearly_return_rate <= -1.0):
+        raise ValueError("etf_yearly_return_rate must be > -1.0")
+    if np.any(yearly_inflation_rate <= -1.0):
+        raise ValueError("yearly_inflation_rate must be > -1.0")
+    if np.any(yearly_apartment_raise_rate <= -1.0):
+        raise ValueError("yearly_apartment_raise_rate must be > -1.0")
+    if np.any(cold_rent_yearly_increase_rate <= -1.0):
+        raise ValueError("cold_rent_yearly_increase_rate must be > -1.0")
+    if np.any(yearly_income_increase_rate <= -1.0):
+        raise ValueError("yearly_income_increase_rate must be > -1.0")
+    if np.any(cold_rent_monthly_cost < 0):
+        raise ValueError("cold_rent_monthly_cost must be >= 0")
+    if np.any(monthly_net_income < 0):
+        raise ValueError("monthly_net_income must be >= 0")
+    if np.any(monthly_spending < 0):
+        raise ValueError("monthly_spending must be >= 0")
+    if np.any(mortgate_refinancing_years < 0):
+        raise ValueError("mortgate_refinancing_years must be >= 0")
+    if np.any(sondertilgung_yearly_rate < 0):
+        raise ValueError("sondertilgung_yearly_rate must be >= 0")
+    if not np.all((0.0 <= etf_tax_rate) & (etf_tax_rate < 1.0)):
+        raise ValueError("etf_tax_rate must be >= 0 and < 1.0")
+
+    initial_loan = mortgage_apartment_price - mortgage_down_payment
+    assert np.all(initial_loan >= 0), "loan_outstanding must be >= 0"
+    initial_cash = initial_capital - mortgage_down_payment - mortgage_total_fees
+
+    # Scenario matrix holding the kernel's float parameters in positional
+    # order, one row per scenario
+    params = np.ascontiguousarray(
+        np.stack(
+            [
+                yearly_inflation_rate,
+                yearly_apartment_raise_rate,
+                mortgage_apartment_price,
+                mortgage_interest_rate,
+                mortgage_yearly_repayment_rate,
+                etf_yearly_return_rate,
+                cold_rent_monthly_cost,
+                cold_rent_yearly_increase_rate,
+                initial_cash,
+                initial_loan,
+                monthly_net_income,
+                monthly_spending,
+                yearly_income_increase_rate,
+                sondertilgung_yearly_rate,
+                etf_tax_rate,
+            ],
+            axis=1,
+        )
+    )
+    mortgate_refinancing_years = np.ascontiguousarray(mortgate_refinancing_years)
+
+    n_scenarios = params.shape[0]
+    out = np.empty((n_scenarios, len(_FRAME_COLUMNS), years + 1), dtype=np.float64)
+    out[:, 0] = np.arange(years + 1)
+
+    # Year 0 rows (initial state before any year passes), for all scenarios
+    _fill_initial_row(
+        {name: out[:, j + 1] for j, name in enumerate(_COLUMNS)},
+        cold_rent_monthly_cost,
+        initial_capital,
+        initial_cash,
+        monthly_net_income,
+        monthly_spending,
+    )
+
+    _simulate_batch(params, mortgate_refinancing_years, years, out)
+
+    return _frames_from_cube(out)
+
+
+def _frames_from_cube(out):
+    """Wrap a (n_scenarios, len(_FRAME_COLUMNS), years + 1) cube into DataFrames.
+
+    Each scenario slice is transposed in place, so every DataFrame is one
+    consolidated float64 block viewing the cube without a copy.
+    """
+    return [
+        pd.DataFrame(frame.T, columns=list(_FRAME_COLUMNS), copy=False)
+        for frame in out
     ]
-    for year in range(1, years + 1):
-        # Property value grows with inflation as a proxy
-        property_value = mortgage_apartment_price * (1.0 + yearly_apartment_raise_rate) ** year
 
-        # Track totals for reporting (will accumulate monthly values)
-        total_interest_paid_this_year = 0.0
-        total_principal_paid_this_year = 0.0
-        total_monthly_spending_this_year = 0.0
 
-        # Cashflow and investments (ETF) done monthly
-        for _ in range(12):
-            if loan_outstanding > 0:
-                monthly_interest_payment = loan_outstanding * mortgage_interest_rate / 12.0
-                monthly_loan_repayment = min(
-                    fixed_monthly_payment - monthly_interest_payment,
-                    loan_outstanding,
-                )
-                actual_mortgage_payment = monthly_interest_payment + monthly_loan_repayment
-                loan_outstanding -= monthly_loan_repayment
-                if loan_outstanding <= 0:
-                    loan_outstanding = 0.0
-                    fixed_monthly_payment = 0.0
-                current_sondertilgung_reserve = sondertilgung_monthly_reserve
-            else:
-                monthly_interest_payment = 0.0
-                monthly_loan_repayment = 0.0
-                actual_mortgage_payment = 0.0
-                current_sondertilgung_reserve = 0.0
+# Keyword parameters of compute_finantial_model, in signature order
+_PARAMETER_NAMES = (
+    "yearly_inflation_rate",
+    "yearly_apartment_raise_rate",
+    "mortgage_apartment_price",
+    "mortgage_interest_rate",
+    "mortgage_down_payment_rate",
+    "mortgage_total_fees_rate",
+    "mortgage_yearly_repayment_rate",
+    "mortgate_refinancing_years",
+    "etf_yearly_return_rate",
+    "cold_rent_monthly_cost",
+    "cold_rent_yearly_increase_rate",
+    "initial_capital",
+    "monthly_net_income",
+    "monthly_spending",
+    "yearly_income_increase_rate",
+    "years",
+    "sondertilgung_yearly_rate",
+    "etf_tax_rate",
+)
 
-            total_interest_paid_this_year += monthly_interest_payment
-            total_principal_paid_this_year += monthly_loan_repayment
-            total_monthly_spending_this_year += current_monthly_spending
+# Position of each float parameter in the kernel scenario matrix; the slot
+# for the derived initial_cash/initial_loan columns depends on parameters
+# that must then stay fixed across a specialized sweep.
+_KERNEL_SLOTS = {
+    "yearly_inflation_rate": 0,
+    "yearly_apartment_raise_rate": 1,
+    "mortgage_apartment_price": 2,
+    "mortgage_interest_rate": 3,
+    "mortgage_yearly_repayment_rate": 4,
+    "etf_yearly_return_rate": 5,
+    "cold_rent_monthly_cost": 6,
+    "cold_rent_yearly_increase_rate": 7,
+    "monthly_net_income": 10,
+    "monthly_spending": 11,
+    "yearly_income_increase_rate": 12,
+    "sondertilgung_yearly_rate": 13,
+    "etf_tax_rate": 14,
+}
 
-            monthly_apartment_spend = current_monthly_rent + actual_mortgage_payment
+# Rate-like parameters whose validation involves no other parameter; only
+# these may vary on the precomputed sweep fast path. Values are
+# (lower_bound, bound_is_exclusive, error_message).
+_SWEEPABLE_VALIDATORS = {
+    "yearly_inflation_rate": (-1.0, True, "yearly_inflation_rate must be > -1.0"),
+    "yearly_apartment_raise_rate": (-1.0, True, "yearly_apartment_raise_rate must be > -1.0"),
+    "mortgage_interest_rate": (0.0, False, "mortgage_interest_rate must be >= 0"),
+    "mortgage_yearly_repayment_rate": (0.0, False, "mortgage_yearly_repayment_rate must be >= 0"),
+    "etf_yearly_return_rate": (-1.0, True, "etf_yearly_return_rate must be > -1.0"),
+    "cold_rent_yearly_increase_rate": (-1.0, True, "cold_rent_yearly_increase_rate must be > -1.0"),
+    "yearly_income_increase_rate": (-1.0, True, "yearly_income_increase_rate must be > -1.0"),
+    "sondertilgung_yearly_rate": (0.0, False, "sondertilgung_yearly_rate must be >= 0"),
+    "etf_tax_rate": (0.0, False, "etf_tax_rate must be >= 0 and < 1.0"),
+}
 
-            monthly_leftover = (
-                current_monthly_income
-                - monthly_apartment_spend
-                - current_monthly_spending
-            )
-            etf_contribution = monthly_leftover - current_sondertilgung_reserve
-            invested_capital += monthly_leftover
-            etf_capital = etf_capital * (1.0 + monthly_etf_rate) + etf_contribution
-            etf_cost_basis += etf_contribution
-            current_monthly_spending *= 1.0 + monthly_inflation_rate
 
-        # Apply sondertilgung at year end
-        actual_sondertilgung = 0.0
-        if loan_outstanding > 0 and max_sondertilgung > 0:
-            actual_sondertilgung = min(max_sondertilgung, loan_outstanding)
-            loan_outstanding -= actual_sondertilgung
-            if loan_outstanding <= 0:
-                loan_outstanding = 0.0
-                fixed_monthly_payment = 0.0
+def compile_finantial_model(fixed_params: dict, varying: list):
+    """
+    Partially evaluate compute_finantial_model_batch for a parameter sweep.
 
-        cumulative_interest_paid += total_interest_paid_this_year
+    `fixed_params` holds every model parameter that stays constant across
+    the sweep; `varying` lists the names supplied per call to the returned
+    function (as scalars or broadcastable 1-D arrays). Everything that
+    depends only on the fixed parameters — normalization, validation, the
+    derived initial cash/loan, the kernel scenario template and the year-0
+    row — is computed once here, so each call of the returned function only
+    fills in the varying slots and runs the compiled kernel.
 
-        # Average monthly values for reporting
-        avg_monthly_interest = total_interest_paid_this_year / 12.0
-        avg_monthly_repayment = total_principal_paid_this_year / 12.0
-        avg_monthly_spending = total_monthly_spending_this_year / 12.0
-        monthly_apartment_spend = current_monthly_rent + fixed_monthly_payment
+    The precomputed fast path requires the varying parameters to be
+    rate-like (growth/interest/return/tax rates); for structural varying
+    parameters (prices, capital, years of refinancing, ...) the returned
+    function simply forwards to compute_finantial_model_batch.
+    """
+    fixed_params = dict(fixed_params)
+    varying = tuple(varying)
+    varying_set = set(varying)
 
-        # ETF after tax: tax only on gains, not on cost basis
-        etf_gain = max(0.0, etf_capital - etf_cost_basis)
-        etf_capital_after_tax = etf_capital - etf_gain * etf_tax_rate
+    unknown = (set(fixed_params) | varying_set) - set(_PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"unknown parameters: {sorted(unknown)}")
+    overlap = set(fixed_params) & varying_set
+    if overlap:
+        raise ValueError(f"parameters both fixed and varying: {sorted(overlap)}")
+    if "years" in varying_set:
+        raise ValueError("years must be a fixed parameter")
+    defaults = {"sondertilgung_yearly_rate": 0.0, "etf_tax_rate": 0.0}
+    missing = set(_PARAMETER_NAMES) - set(fixed_params) - varying_set - set(defaults)
+    if missing:
+        raise ValueError(f"missing parameters: {sorted(missing)}")
 
-        # Estimated total capital = invested capital + property equity
-        property_equity = property_value - loan_outstanding
-        estimated_total_capital = property_equity + etf_capital_after_tax
-
-        rows.append(
-            {
-                "year": year,
-                "total_loan": loan_outstanding,
-                "estimated_total_capital": estimated_total_capital,
-                "monthly_interest_payment": avg_monthly_interest,
-                "monthly_loan_repayment": avg_monthly_repayment,
-                "monthly_rent": current_monthly_rent,
-                "monthly_apartment_spend": monthly_apartment_spend,
-                "monthly_spending": current_monthly_spending,
-                "monthly_income": current_monthly_income,
-                "monthly_leftover": monthly_leftover,
-                "invested_capital": invested_capital,
-                "etf_capital": etf_capital,
-                "etf_capital_after_tax": etf_capital_after_tax,
-                "spending_not_covered_by_3_percent_etf": (avg_monthly_spending + monthly_apartment_spend) - (etf_capital_after_tax * 3 / 100) / 12,
-                "property_value": property_value,
-                "property_equity": property_equity,
-                "yearly_sondertilgung": actual_sondertilgung,
-                "cumulative_interest_paid": cumulative_interest_paid,
-            }
+    if not varying_set <= set(_SWEEPABLE_VALIDATORS):
+        # Structural parameter varies: no precomputation possible beyond
+        # binding the fixed values.
+        def specialized(**kwargs):
+            return compute_finantial_model_batch(**fixed_params, **kwargs)
+
+        return specialized
+
+    # Run the single-scenario model once on the fixed parameters (with
+    # benign values in the varying slots) to reuse its full validation.
+    probe = {name: 0.0 for name in varying}
+    compute_finantial_model(**{**defaults, **fixed_params, **probe})
+
+    years = fixed_params["years"]
+    mortgate_refinancing_years = fixed_params["mortgate_refinancing_years"]
+    mortgage_apartment_price = float(fixed_params["mortgage_apartment_price"])
+    mortgage_down_payment = mortgage_apartment_price * float(fixed_params["mortgage_down_payment_rate"])
+    mortgage_total_fees = mortgage_apartment_price * float(fixed_params["mortgage_total_fees_rate"])
+    initial_capital = float(fixed_params["initial_capital"])
+    initial_cash = initial_capital - mortgage_down_payment - mortgage_total_fees
+    initial_loan = mortgage_apartment_price - mortgage_down_payment
+
+    template = np.empty(len(_KERNEL_SLOTS) + 2, dtype=np.float64)
+    for name, slot in _KERNEL_SLOTS.items():
+        value = {**defaults, **fixed_params}.get(name)
+        template[slot] = 0.0 if value is None else float(value)
+    template[8] = initial_cash
+    template[9] = initial_loan
+
+    initial_row = np.empty(len(_COLUMNS), dtype=np.float64)
+    _fill_initial_row(
+        {name: initial_row[j:j + 1] for j, name in enumerate(_COLUMNS)},
+        float(fixed_params["cold_rent_monthly_cost"]),
+        initial_capital,
+        initial_cash,
+        float(fixed_params["monthly_net_income"]),
+        float(fixed_params["monthly_spending"]),
+    )
+
+    def specialized(**kwargs):
+        if set(kwargs) != varying_set:
+            raise ValueError(f"expected exactly the varying parameters {sorted(varying_set)}")
+        values = np.broadcast_arrays(
+            *(np.asarray(kwargs[name], dtype=np.float64) for name in varying)
         )
+        values = [np.atleast_1d(value) for value in values]
+        for name, value in zip(varying, values):
+            lower_bound, exclusive, message = _SWEEPABLE_VALIDATORS[name]
+            if np.any(value <= lower_bound if exclusive else value < lower_bound):
+                raise ValueError(message)
+            if name == "etf_tax_rate" and np.any(value >= 1.0):
+                raise ValueError(message)
 
-        # Prepare next year values (income/rent growth and possible refinancing)
-        current_monthly_income *= 1.0 + yearly_income_increase_rate
-        current_monthly_rent *= 1.0 + cold_rent_yearly_increase_rate
+        n_scenarios = values[0].shape[0] if values else 1
+        params = np.tile(template, (n_scenarios, 1))
+        for name, value in zip(varying, values):
+            params[:, _KERNEL_SLOTS[name]] = value
+        refinancing = np.full(n_scenarios, mortgate_refinancing_years, dtype=np.int64)
 
-        # Recalculate loan base and fixed payment on refinancing schedule
-        if (
-            loan_outstanding > 0
-            and mortgate_refinancing_years > 0
-            and (year % mortgate_refinancing_years == 0)
-        ):
-            loan_base = loan_outstanding
-            fixed_monthly_payment = loan_base * (mortgage_interest_rate + mortgage_yearly_repayment_rate) / 12.0
+        out = np.empty((n_scenarios, len(_FRAME_COLUMNS), years + 1), dtype=np.float64)
+        out[:, 0] = np.arange(years + 1)
+        out[:, 1:, 0] = initial_row
+        _simulate_batch(params, refinancing, years, out)
+        return _frames_from_cube(out)
 
-    return pd.DataFrame(rows)
+    return specialized
 
 
 def calculate_early_repayment_penalty(